@@ -15,7 +15,7 @@ References:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Sequence
 
 import grpc
 
@@ -28,15 +28,26 @@ except ModuleNotFoundError:  # pragma: no cover
     rpc_status = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldViolation:
     field: str
     description: str
 
 
+# grpc.StatusCode.value is a tuple: (int, 'NAME'); resolve the ints once.
+_GRPC_CODE_INTS = {code: int(code.value[0]) for code in grpc.StatusCode}
+
+_RETRYABLE_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.ABORTED,
+    }
+)
+
+
 def _grpc_code_int(code: grpc.StatusCode) -> int:
-    # grpc.StatusCode.value is a tuple: (int, 'NAME')
-    return int(code.value[0])
+    return _GRPC_CODE_INTS[code]
 
 
 @dataclass(frozen=True)
@@ -86,14 +97,11 @@ def build_public_status(spec: PublicErrorSpec) -> status_pb2.Status:
         )
     )
     if spec.violations:
-        st.details.add().Pack(
-            error_details_pb2.BadRequest(
-                field_violations=[
-                    error_details_pb2.BadRequest.FieldViolation(field=v.field, description=v.description)
-                    for v in spec.violations
-                ]
-            )
-        )
+        bad_request = error_details_pb2.BadRequest()
+        add_violation = bad_request.field_violations.add
+        for v in spec.violations:
+            add_violation(field=v.field, description=v.description)
+        st.details.add().Pack(bad_request)
     if spec.retry_delay_seconds is not None:
         retry = error_details_pb2.RetryInfo()
         retry.retry_delay.seconds = int(spec.retry_delay_seconds)
@@ -197,23 +205,19 @@ def abort_with_error_info(
             message=message,
             reason=reason,
             domain=domain,
-            retryable=grpc_code in {
-                grpc.StatusCode.UNAVAILABLE,
-                grpc.StatusCode.RESOURCE_EXHAUSTED,
-                grpc.StatusCode.ABORTED,
-            },
+            retryable=grpc_code in _RETRYABLE_CODES,
             metadata=metadata,
-            retry_delay_seconds=1
-            if grpc_code in {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.StatusCode.ABORTED}
-            else None,
+            retry_delay_seconds=1 if grpc_code in _RETRYABLE_CODES else None,
         ),
     )
 
-def required_string(value: str, field: str) -> Iterable[FieldViolation]:
+def required_string(value: str, field: str) -> FieldViolation | None:
     if not value:
-        yield FieldViolation(field=field, description="field is required")
+        return FieldViolation(field=field, description="field is required")
+    return None
 
 
-def positive_int(value: int, field: str) -> Iterable[FieldViolation]:
+def positive_int(value: int, field: str) -> FieldViolation | None:
     if value <= 0:
-        yield FieldViolation(field=field, description="must be > 0")
+        return FieldViolation(field=field, description="must be > 0")
+    return None
@@ -7,6 +7,7 @@ import os
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
@@ -50,6 +51,14 @@ from .validation import (
     validate_reserve_device,
     validate_submit_job,
 )
+from .settings import grpc_worker_count
+from .proto_gen import ensure_generated
+
+ensure_generated()
+
+from eigen.api.v1 import device_service_pb2 as dev_pb  # noqa: E402
+from eigen.api.v1 import job_service_pb2 as job_pb  # noqa: E402
+from eigen.api.v1 import types_pb2 as types_pb  # noqa: E402
 
 
 TERMINAL_JOB_STATES = {"JOB_STATE_DONE", "JOB_STATE_ERROR", "JOB_STATE_CANCELLED", "JOB_STATE_TIMEOUT"}
@@ -58,6 +67,14 @@ TOPOLOGY_LINEAGE_VERSION = "1.1.0"
 TENANT_ENVELOPE_CONTRACT_VERSION = "1.0.0"
 PUBLIC_API_CONTRACT_VERSION = "1.0.0"
 _SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:[-+][0-9A-Za-z.-]+)?$")
+_DEFAULT_TOPOLOGY_PB = types_pb.TopologyEnvelope(
+    contract_version=TOPOLOGY_CONTRACT_VERSION,
+    lineage_version=TOPOLOGY_LINEAGE_VERSION,
+    cluster_id="cluster-local",
+    worker_id="worker-local",
+    partition_id="partition-0",
+    attempt=1,
+)
 
 
 def _metadata(context: grpc.ServicerContext) -> dict[str, str]:
@@ -198,9 +215,66 @@ def _envelope_value(envelope, field: str) -> str:
     return str(getattr(envelope, field, "") or "").strip() if envelope is not None else ""
 
 
+class _KernelLoop:
+    """Long-lived event loop that drives KernelGatewayClient coroutines.
+
+    Servicer threads submit coroutines here instead of spinning up a fresh
+    loop (and default executor) per kernel call via ``asyncio.run``. The
+    loop starts on first use; ``close`` stops it, and a later ``run`` starts
+    a new one.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Every gRPC worker can park one blocking kernel call (or one
+                # StreamJobUpdates read) in this executor, so size it to the
+                # worker pool; otherwise open streams starve unary calls.
+                executor = ThreadPoolExecutor(
+                    max_workers=max(grpc_worker_count(), min(32, (os.cpu_count() or 1) + 4)),
+                    thread_name_prefix="system-api-kernel",
+                )
+                loop.set_default_executor(executor)
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="system-api-kernel-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread, self._executor = loop, thread, executor
+            return self._loop
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def close(self) -> None:
+        """Stop the loop thread and shut down its executor."""
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            self._loop = self._thread = self._executor = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        loop.close()
+
+
+_KERNEL_LOOP = _KernelLoop()
+
+
 def _ts_now() -> Timestamp:
     ts = Timestamp()
-    ts.FromDatetime(datetime.now(timezone.utc))
+    ts.GetCurrentTime()
     return ts
 
 
@@ -210,6 +284,26 @@ def _ts_from_unix(seconds: float) -> Timestamp:
     return ts
 
 
+def _eigen_lang_payload(program) -> tuple[bytes, str]:
+    return bytes(program.source), "eigen_lang_source"
+
+
+def _qasm_payload(program) -> tuple[bytes, str]:
+    return bytes(program.source), "qasm_text"
+
+
+def _aqo_ref_payload(program) -> tuple[bytes, str]:
+    return str(getattr(program, "qfs_ref", "") or "").encode("utf-8"), "aqo_ref"
+
+
+# SubmitJobRequest.program oneof name -> (payload bytes, kernel program_format).
+_PROGRAM_PAYLOAD_BUILDERS = {
+    "eigen_lang": _eigen_lang_payload,
+    "qasm": _qasm_payload,
+    "aqo_ref": _aqo_ref_payload,
+}
+
+
 @dataclass
 class _ReservationRecord:
     reservation_id: str
@@ -263,9 +357,7 @@ class _ReservationRecord:
 class DeviceService:
     """Implementation of eigen.api.v1.DeviceService."""
 
-    def __init__(self, dev_pb, types_pb):
-        self._dev_pb = dev_pb
-        self._types_pb = types_pb
+    def __init__(self):
         self._reservation_store_path = Path(
             os.getenv("SYSTEM_API_RESERVATION_STORE_PATH", "/tmp/eigen-system-api-reservations.json")
         )
@@ -273,6 +365,21 @@ class DeviceService:
         self._reservations: dict[str, _ReservationRecord] = {}
         self._lock = threading.RLock()
         self._load_reservation_records()
+        # The simulator inventory is static; build the response once and hand
+        # the same message to every ListDevices call (it is never mutated).
+        self._list_devices_resp = dev_pb.ListDevicesResponse(
+            devices=[
+                types_pb.DeviceInfo(
+                    device_id="sim:local",
+                    name="Local simulator",
+                    backend_type="simulator",
+                    status=types_pb.DEVICE_STATUS_ONLINE,
+                    queue_depth=0,
+                    estimated_wait_sec=0,
+                    capabilities={"shots": "1024"},
+                )
+            ]
+        )
 
     def _reservation_binding_key(
         self,
@@ -389,25 +496,16 @@ class DeviceService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        # backend_type is optional
-        resp = self._dev_pb.ListDevicesResponse(
-            devices=[
-                self._types_pb.DeviceInfo(
-                    device_id="sim:local",
-                    name="Local simulator",
-                    backend_type="simulator",
-                    status=self._types_pb.DEVICE_STATUS_ONLINE,
-                    queue_depth=0,
-                    estimated_wait_sec=0,
-                    capabilities={"shots": "1024"},
-                )
-            ]
-        )
-
         log_request_end("DeviceService.ListDevices", rc)
-        return resp
+        return self._list_devices_resp
 
-    def GetDeviceDetails(self, request, context: grpc.ServicerContext):
+    def GetDeviceDetails(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_device_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="DeviceService.GetDeviceDetails")
         enforce_authz(context, required_permission="devices:list")
         rc = new_request_context(context)
@@ -421,23 +519,29 @@ class DeviceService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        violations = validate_device_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
-        resp = self._dev_pb.GetDeviceDetailsResponse(
-            device=self._types_pb.DeviceInfo(
+        resp = dev_pb.GetDeviceDetailsResponse(
+            device=types_pb.DeviceInfo(
                 device_id=request.device_id,
                 name="Device",
                 backend_type="simulator",
-                status=self._types_pb.DEVICE_STATUS_ONLINE,
+                status=types_pb.DEVICE_STATUS_ONLINE,
             )
         )
 
         log_request_end("DeviceService.GetDeviceDetails", rc)
         return resp
 
-    def GetDeviceStatus(self, request, context: grpc.ServicerContext):
+    def GetDeviceStatus(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_device_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="DeviceService.GetDeviceStatus")
         enforce_authz(context, required_permission="devices:list")
         rc = new_request_context(context)
@@ -451,22 +555,27 @@ class DeviceService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        violations = validate_device_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
-        resp = self._dev_pb.GetDeviceStatusResponse(
+        resp = dev_pb.GetDeviceStatusResponse(
             device_id=request.device_id,
-            status=self._types_pb.DEVICE_STATUS_ONLINE,
+            status=types_pb.DEVICE_STATUS_ONLINE,
             queue_depth=0,
             estimated_wait_sec=0,
-            metadata={},
         )
 
         log_request_end("DeviceService.GetDeviceStatus", rc)
         return resp
 
-    def ReserveDevice(self, request, context: grpc.ServicerContext):
+    def ReserveDevice(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_reserve_device,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="DeviceService.ReserveDevice")
         enforce_authz(context, required_permission="devices:reserve")
         rc = new_request_context(context)
@@ -480,9 +589,9 @@ class DeviceService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        violations = validate_reserve_device(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
         owner_subject, _, owner_tenant = auth_context(context)
         owner_project = envelope.project_id or "project-default"
@@ -569,7 +678,7 @@ class DeviceService:
             self._persist_reservation_records()
             self._write_reservation_artifact(record)
 
-        resp = self._dev_pb.ReserveDeviceResponse(
+        resp = dev_pb.ReserveDeviceResponse(
             reservation_id=record.reservation_id,
             expires_at=_ts_from_unix(record.expires_at_unix),
         )
@@ -613,21 +722,23 @@ class _IdempotencyRecord:
 class JobService:
     """Thin public ingress facade for eigen.api.v1.JobService."""
 
-    def __init__(self, job_pb, types_pb, kernel_client: KernelGatewayClient | None = None):
-        self._job_pb = job_pb
-        self._types_pb = types_pb
+    def __init__(self, kernel_client: KernelGatewayClient | None = None):
         self._kernel_client = kernel_client or KernelGatewayClient()
         self._lock = threading.RLock()
         self._idempotency_store_path = Path(
             os.getenv("SYSTEM_API_IDEMPOTENCY_STORE_PATH", "/tmp/eigen-system-api-idempotency.json")
         )
         self._idempotency_ttl_sec = max(float(os.getenv("SYSTEM_API_IDEMPOTENCY_TTL_SECONDS", "86400")), 1.0)
+        self._dispatch_rationale_poll_sec = max(
+            float(os.getenv("SYSTEM_API_DISPATCH_RATIONALE_POLL_SECONDS", "0.1")),
+            0.01,
+        )
         self._idempotency: dict[str, _IdempotencyRecord] = {}
         self._load_idempotency_records()
 
     @staticmethod
     def _run(coro):
-        return asyncio.run(coro)
+        return _KERNEL_LOOP.run(coro)
 
     @staticmethod
     def _default_program_payload() -> tuple[bytes, str]:
@@ -639,15 +750,10 @@ class JobService:
     @staticmethod
     def _build_program_payload(request) -> tuple[bytes, str]:
         program_kind = request.WhichOneof("program")
-        if program_kind == "eigen_lang":
-            return bytes(request.eigen_lang.source), "eigen_lang_source"
-        if program_kind == "qasm":
-            return bytes(request.qasm.source), "qasm_text"
-        if program_kind == "aqo_ref":
-            ref = str(getattr(request.aqo_ref, "qfs_ref", "") or "")
-            return ref.encode("utf-8"), "aqo_ref"
-        program_bytes, program_format = JobService._default_program_payload()
-        return program_bytes, program_format
+        builder = _PROGRAM_PAYLOAD_BUILDERS.get(program_kind)
+        if builder is None:
+            return JobService._default_program_payload()
+        return builder(getattr(request, program_kind))
 
 
     def _kernel_call(self, context: grpc.ServicerContext, func, *, not_found_reason: str | None = None, **kwargs):
@@ -669,50 +775,50 @@ class JobService:
                 )
             context.abort(code, details)
 
-    def _retry_dispatch_rationale(self, request, context: grpc.ServicerContext, envelope: NormalizedPublicEnvelope):
+    def _retry_dispatch_rationale(self, request, envelope: NormalizedPublicEnvelope):
         deadline = time.time() + float(os.getenv("SYSTEM_API_DISPATCH_RATIONALE_WAIT_SECONDS", "30"))
-        last_exc: grpc.RpcError | None = None
+        return self._run(
+            self._await_dispatch_rationale(
+                job_id=request.job_id,
+                public_envelope=self._public_envelope_dict(envelope),
+                deadline=deadline,
+            )
+        )
+
+    async def _await_dispatch_rationale(self, *, job_id: str, public_envelope: dict[str, object], deadline: float):
+        """Poll until the kernel has recorded a dispatch decision for ``job_id``.
+
+        The retry loop runs as one coroutine on the kernel loop, which saves a
+        loop round trip per attempt. The calling gRPC worker still blocks in
+        ``_KERNEL_LOOP.run`` for the whole wait, up to
+        ``SYSTEM_API_DISPATCH_RATIONALE_WAIT_SECONDS``. Kernel errors other
+        than FAILED_PRECONDITION (decision not yet recorded), or running past
+        ``deadline``, propagate to the caller.
+        """
+        poll_sec = self._dispatch_rationale_poll_sec
         while True:
             try:
-                return self._run(
-                    self._kernel_client.get_dispatch_rationale(
-                        job_id=request.job_id,
-                        public_envelope=self._public_envelope_dict(envelope),
-                    )
+                return await self._kernel_client.get_dispatch_rationale(
+                    job_id=job_id,
+                    public_envelope=public_envelope,
                 )
             except grpc.RpcError as exc:
-                last_exc = exc
                 code = exc.code() if hasattr(exc, "code") else grpc.StatusCode.INTERNAL
-                details = exc.details() if hasattr(exc, "details") else "kernel gateway error"
-                if code == grpc.StatusCode.NOT_FOUND:
-                    abort_public(
-                        context,
-                        PublicErrorSpec(
-                            grpc_code=grpc.StatusCode.NOT_FOUND,
-                            message=details,
-                            reason="EIGEN_PUBLIC_EXPLAIN_DECISION_NOT_FOUND",
-                            retryable=False,
-                            detail=details,
-                        ),
-                    )
                 if code != grpc.StatusCode.FAILED_PRECONDITION or time.time() >= deadline:
-                    context.abort(code, details)
-                try:
-                    status = self._run(
-                        self._kernel_client.get_job_status(
-                            job_id=request.job_id,
-                            public_envelope=self._public_envelope_dict(envelope),
-                        )
-                    )
-                except grpc.RpcError:
-                    time.sleep(0.1)
-                    continue
-                if status.get("state") in {"TASK_STATE_DONE", "TASK_STATE_ERROR", "TASK_STATE_CANCELLED", "TASK_STATE_TIMEOUT"}:
-                    time.sleep(0.05)
-                else:
-                    time.sleep(0.1)
-        if last_exc is not None:
-            raise last_exc
+                    raise
+            try:
+                status = await self._kernel_client.get_job_status(
+                    job_id=job_id,
+                    public_envelope=public_envelope,
+                )
+            except grpc.RpcError:
+                await asyncio.sleep(poll_sec)
+                continue
+            if status.get("state") in {"TASK_STATE_DONE", "TASK_STATE_ERROR", "TASK_STATE_CANCELLED", "TASK_STATE_TIMEOUT"}:
+                # Terminal jobs record their decision shortly; re-check sooner.
+                await asyncio.sleep(poll_sec / 2)
+            else:
+                await asyncio.sleep(poll_sec)
 
     @staticmethod
     def _normalized_name(request) -> str:
@@ -737,33 +843,28 @@ class JobService:
 
     def _kernel_state_to_public_enum(self, state: str):
         mapping = {
-            "TASK_STATE_PENDING": self._types_pb.JOB_STATE_PENDING,
-            "TASK_STATE_COMPILING": self._types_pb.JOB_STATE_COMPILING,
-            "TASK_STATE_OPTIMIZING": self._types_pb.JOB_STATE_COMPILING,
-            "TASK_STATE_QUEUED": self._types_pb.JOB_STATE_QUEUED,
-            "TASK_STATE_RUNNING": self._types_pb.JOB_STATE_RUNNING,
-            "TASK_STATE_DONE": self._types_pb.JOB_STATE_DONE,
-            "TASK_STATE_ERROR": self._types_pb.JOB_STATE_ERROR,
-            "TASK_STATE_CANCELLED": self._types_pb.JOB_STATE_CANCELLED,
-            "TASK_STATE_TIMEOUT": self._types_pb.JOB_STATE_TIMEOUT,
+            "TASK_STATE_PENDING": types_pb.JOB_STATE_PENDING,
+            "TASK_STATE_COMPILING": types_pb.JOB_STATE_COMPILING,
+            "TASK_STATE_OPTIMIZING": types_pb.JOB_STATE_COMPILING,
+            "TASK_STATE_QUEUED": types_pb.JOB_STATE_QUEUED,
+            "TASK_STATE_RUNNING": types_pb.JOB_STATE_RUNNING,
+            "TASK_STATE_DONE": types_pb.JOB_STATE_DONE,
+            "TASK_STATE_ERROR": types_pb.JOB_STATE_ERROR,
+            "TASK_STATE_CANCELLED": types_pb.JOB_STATE_CANCELLED,
+            "TASK_STATE_TIMEOUT": types_pb.JOB_STATE_TIMEOUT,
         }
         if state in mapping:
             return mapping[state]
         if state.startswith("JOB_STATE_"):
-            return getattr(self._types_pb, state, self._types_pb.JOB_STATE_PENDING)
-        return getattr(self._types_pb, f"JOB_STATE_{state}", self._types_pb.JOB_STATE_PENDING)
+            return getattr(types_pb, state, types_pb.JOB_STATE_PENDING)
+        return getattr(types_pb, f"JOB_STATE_{state}", types_pb.JOB_STATE_PENDING)
 
     def _mk_topology_pb(self, topology: dict[str, object] | None):
         if not topology:
-            return self._types_pb.TopologyEnvelope(
-                contract_version=TOPOLOGY_CONTRACT_VERSION,
-                lineage_version=TOPOLOGY_LINEAGE_VERSION,
-                cluster_id="cluster-local",
-                worker_id="worker-local",
-                partition_id="partition-0",
-                attempt=1,
-            )
-        return self._types_pb.TopologyEnvelope(
+            # Callers pass this as a constructor kwarg, which copies it, so
+            # the shared template is never mutated.
+            return _DEFAULT_TOPOLOGY_PB
+        return types_pb.TopologyEnvelope(
             contract_version=str(topology.get("contract_version", TOPOLOGY_CONTRACT_VERSION)),
             lineage_version=str(topology.get("lineage_version", TOPOLOGY_LINEAGE_VERSION)),
             cluster_id=str(topology.get("cluster_id", "cluster-local")),
@@ -774,14 +875,15 @@ class JobService:
 
 
     def _status_from_kernel(self, job_id: str, kernel_response: dict):
-        return self._types_pb.JobStatus(
+        created_at = kernel_response.get("created_at") or _ts_now()
+        return types_pb.JobStatus(
             job_id=job_id,
             state=self._kernel_state_to_public_enum(kernel_response.get("state", "TASK_STATE_PENDING")),
             stage=kernel_response.get("stage", ""),
             progress=float(kernel_response.get("progress", 0.0)),
             message=kernel_response.get("message", ""),
-            created_at=kernel_response.get("created_at") or _ts_now(),
-            updated_at=kernel_response.get("updated_at") or kernel_response.get("created_at") or _ts_now(),
+            created_at=created_at,
+            updated_at=kernel_response.get("updated_at") or created_at,
             error_code=kernel_response.get("error_code", ""),
             error_summary=kernel_response.get("error_summary", ""),
             error_details_ref=kernel_response.get("error_details_ref", ""),
@@ -790,7 +892,7 @@ class JobService:
     
 
     def _update_from_kernel(self, job_id: str, kernel_update: dict):
-        return self._types_pb.JobUpdate(
+        return types_pb.JobUpdate(
             job_id=job_id,
             state=self._kernel_state_to_public_enum(kernel_update.get("state", "TASK_STATE_PENDING")),
             stage=kernel_update.get("stage", ""),
@@ -809,7 +911,7 @@ class JobService:
                 "topology_contract_version",
                 str(topology.get("contract_version", TOPOLOGY_CONTRACT_VERSION)),
             )
-        return self._job_pb.DispatchRationale(
+        return job_pb.DispatchRationale(
             version=kernel_rationale.get("version", ""),
             policy_version=kernel_rationale.get("policy_version", ""),
             reason_codes=list(kernel_rationale.get("reason_codes", [])),
@@ -881,18 +983,13 @@ class JobService:
         metadata = {str(k): str(v) for k, v in sorted(dict(getattr(request, "metadata", {})).items())}
         compiler_options = {str(k): str(v) for k, v in sorted(dict(getattr(request, "compiler_options", {})).items())}
         program_kind = request.WhichOneof("program")
-        if program_kind == "eigen_lang":
-            program_digest = sha256(bytes(request.eigen_lang.source)).hexdigest()
-        elif program_kind == "qasm":
-            program_digest = sha256(bytes(request.qasm.source)).hexdigest()
-        elif program_kind == "aqo_ref":
-            ref = str(getattr(request.aqo_ref, "qfs_ref", "") or "")
-            program_kind = "aqo_ref"
-            program_digest = sha256(ref.encode("utf-8")).hexdigest()
-        else:
+        builder = _PROGRAM_PAYLOAD_BUILDERS.get(program_kind)
+        if builder is None:
             program_bytes, _ = self._default_program_payload()
             program_kind = "eigen_lang"
-            program_digest = sha256(program_bytes).hexdigest()
+        else:
+            program_bytes, _ = builder(getattr(request, program_kind))
+        program_digest = sha256(program_bytes).hexdigest()
 
         payload = {
             "name": self._normalized_name(request),
@@ -913,7 +1010,13 @@ class JobService:
         }
         return sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
 
-    def SubmitJob(self, request, context: grpc.ServicerContext):
+    def SubmitJob(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_submit_job,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.SubmitJob")
         enforce_authz(context, required_permission="jobs:submit")
         rc = new_request_context(context)
@@ -927,9 +1030,9 @@ class JobService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        violations = validate_submit_job(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
         name = self._normalized_name(request)
         target = self._normalized_target(request)
@@ -975,7 +1078,7 @@ class JobService:
             record_public_api_contract_marker(envelope.contract_version, "replayed")
             record_submit_job_outcome("replayed")
             log_request_end("JobService.SubmitJob", rc)
-            return self._job_pb.SubmitJobResponse(job_id=job_id, status=resp_status)
+            return job_pb.SubmitJobResponse(job_id=job_id, status=resp_status)
 
         kernel_response = self._kernel_call(
             context,
@@ -991,15 +1094,16 @@ class JobService:
             workload=getattr(request, "workload", None),
         )
         job_id = kernel_response["job_id"]
-        status = self._types_pb.JobStatus(
+        created_at = kernel_response.get("created_at") or _ts_now()
+        status = types_pb.JobStatus(
             job_id=job_id,
             state=self._kernel_state_to_public_enum(kernel_response.get("state", "TASK_STATE_PENDING")),
             message=kernel_response.get("message", "accepted"),
-            created_at=kernel_response.get("created_at") or _ts_now(),
-            updated_at=kernel_response.get("updated_at") or kernel_response.get("created_at") or _ts_now(),
+            created_at=created_at,
+            updated_at=kernel_response.get("updated_at") or created_at,
             topology=self._mk_topology_pb(kernel_response.get("topology")),
         )
-        resp = self._job_pb.SubmitJobResponse(job_id=job_id, status=status)
+        resp = job_pb.SubmitJobResponse(job_id=job_id, status=status)
         with self._lock:
             self._idempotency[job_idempotency_key] = _IdempotencyRecord(
                 job_id=job_id,
@@ -1014,7 +1118,13 @@ class JobService:
         log_request_end("JobService.SubmitJob", rc)
         return resp
 
-    def GetJobStatus(self, request, context: grpc.ServicerContext):
+    def GetJobStatus(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_job_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.GetJobStatus")
         enforce_authz(context, required_permission="jobs:read")
         rc = new_request_context(context)
@@ -1028,9 +1138,9 @@ class JobService:
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
 
-        violations = validate_job_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
         kernel_response = self._kernel_call(
             context,
@@ -1039,13 +1149,19 @@ class JobService:
             public_envelope=self._public_envelope_dict(envelope),
             not_found_reason="EIGEN_PUBLIC_JOB_NOT_FOUND",
         )
-        resp = self._job_pb.GetJobStatusResponse(
+        resp = job_pb.GetJobStatusResponse(
             status=self._status_from_kernel(request.job_id, kernel_response)
         )
         log_request_end("JobService.GetJobStatus", rc)
         return resp
 
-    def CancelJob(self, request, context: grpc.ServicerContext):
+    def CancelJob(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_job_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.CancelJob")
         enforce_authz(context, required_permission="jobs:submit")
         rc = new_request_context(context)
@@ -1058,9 +1174,9 @@ class JobService:
         rc.auth_mode = sec.auth_mode
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
-        violations = validate_job_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
         accepted = self._kernel_call(
             context,
             self._kernel_client.cancel_job,
@@ -1069,9 +1185,15 @@ class JobService:
             not_found_reason="EIGEN_PUBLIC_JOB_NOT_FOUND",
         )
         log_request_end("JobService.CancelJob", rc)
-        return self._job_pb.CancelJobResponse(accepted=bool(accepted.get("accepted", False)))
+        return job_pb.CancelJobResponse(accepted=bool(accepted.get("accepted", False)))
 
-    def StreamJobUpdates(self, request, context: grpc.ServicerContext):
+    def StreamJobUpdates(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_job_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.StreamJobUpdates")
         enforce_authz(context, required_permission="jobs:read")
         rc = new_request_context(context)
@@ -1084,9 +1206,9 @@ class JobService:
         rc.auth_mode = sec.auth_mode
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
-        violations = validate_job_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
         async def _collect():
             items = []
@@ -1105,7 +1227,7 @@ class JobService:
                 if event_seq <= last_emitted_seq:
                     continue
                 last_emitted_seq = event_seq
-                yield self._job_pb.StreamJobUpdatesResponse(
+                yield job_pb.StreamJobUpdatesResponse(
                     update=self._update_from_kernel(request.job_id, kernel_update)
                 )
         except grpc.RpcError as exc:
@@ -1113,7 +1235,13 @@ class JobService:
         finally:
             log_request_end("JobService.StreamJobUpdates", rc)
 
-    def GetJobResults(self, request, context: grpc.ServicerContext):
+    def GetJobResults(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_job_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.GetJobResults")
         enforce_authz(context, required_permission="jobs:read")
         rc = new_request_context(context)
@@ -1126,9 +1254,13 @@ class JobService:
         rc.auth_mode = sec.auth_mode
         rc.policy_version = sec.policy_version
         rc.service_identity = sec.service_identity
-        violations = validate_job_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
+        # Result count maps grow as 2^n string keys with int values; gzip
+        # removes most of that redundancy. Other RPCs stay uncompressed.
+        if hasattr(context, "set_compression"):
+            context.set_compression(grpc.Compression.Gzip)
 
         kernel_response = self._kernel_call(
             context,
@@ -1137,7 +1269,7 @@ class JobService:
             public_envelope=self._public_envelope_dict(envelope),
             not_found_reason="EIGEN_PUBLIC_JOB_NOT_FOUND",
         )
-        resp = self._job_pb.GetJobResultsResponse(
+        resp = job_pb.GetJobResultsResponse(
             job_id=kernel_response.get("job_id", request.job_id),
             state=self._kernel_state_to_public_enum(kernel_response.get("state", "TASK_STATE_PENDING")),
             counts=dict(kernel_response.get("counts", {})),
@@ -1150,7 +1282,13 @@ class JobService:
         log_request_end("JobService.GetJobResults", rc)
         return resp
 
-    def GetDispatchRationale(self, request, context: grpc.ServicerContext):
+    def GetDispatchRationale(
+        self,
+        request,
+        context: grpc.ServicerContext,
+        _validate=validate_job_id,
+        _abort=abort_invalid_argument,
+    ):
         enforce_authn(context, method_name="JobService.GetDispatchRationale")
         enforce_authz(context, required_permission="jobs:read")
         rc = new_request_context(context)
@@ -1174,12 +1312,12 @@ class JobService:
                     detail="job_id must be provided for dispatch rationale lookup.",
                 ),
             )
-        violations = validate_job_id(request)
+        violations = _validate(request)
         if violations:
-            abort_invalid_argument(context, "validation failed", violations)
+            _abort(context, "validation failed", violations)
 
         try:
-            kernel_response = self._retry_dispatch_rationale(request, context, envelope)
+            kernel_response = self._retry_dispatch_rationale(request, envelope)
         except grpc.RpcError as exc:
             code = exc.code() if hasattr(exc, "code") else grpc.StatusCode.INTERNAL
             details = exc.details() if hasattr(exc, "details") else "kernel gateway error"
@@ -1195,7 +1333,7 @@ class JobService:
                     ),
                 )
             context.abort(code, details)
-        resp = self._job_pb.GetDispatchRationaleResponse(
+        resp = job_pb.GetDispatchRationaleResponse(
             rationale=self._rationale_from_kernel(kernel_response)
         )
         log_request_end("JobService.GetDispatchRationale", rc)
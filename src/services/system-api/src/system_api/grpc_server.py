@@ -3,7 +3,7 @@ from __future__ import annotations
 import contextvars
 import logging
 import os
-import uuid
+import secrets
 from concurrent import futures
 from typing import Any, Callable
 
@@ -18,6 +18,7 @@ except ModuleNotFoundError:  # pragma: no cover - lightweight test envs
 from .grpc_impl import DeviceService, JobService
 from .observability import trace_id_from_traceparent
 from .proto_gen import ensure_generated
+from .settings import grpc_worker_count, int_env
 
 _LOG = logging.getLogger("system_api")
 
@@ -51,9 +52,9 @@ class TracingAndLoggingInterceptor(grpc.ServerInterceptor):
         # Pull traceparent (W3C standard) or fallback to basic trace_id
         raw_traceparent = metadata.get("traceparent")
         raw_trace_id = metadata.get("trace_id")
-        traceparent = raw_traceparent or raw_trace_id or f"root-{uuid.uuid4()}"
+        traceparent = raw_traceparent or raw_trace_id or f"root-{secrets.token_hex(16)}"
         trace_id = raw_trace_id or trace_id_from_traceparent(raw_traceparent) or traceparent
-        request_id = metadata.get("x-request-id") or str(uuid.uuid4())
+        request_id = metadata.get("x-request-id") or secrets.token_hex(16)
         
         # Bind tokens to the async execution context
         token_trace = ctx_trace_id.set(trace_id)
@@ -179,35 +180,58 @@ def configure_logging():
 
 # --- Core Server Hook ---
 
+def _grpc_max_concurrent_rpcs(workers: int) -> int:
+    return int_env("SYSTEM_API_GRPC_MAX_CONCURRENT", 4 * workers)
+
+
+def _grpc_max_send_message_bytes() -> int:
+    return int_env("SYSTEM_API_GRPC_MAX_SEND_MESSAGE_BYTES", 64 * 1024 * 1024)
+
+
 def serve(bind: str | None = None) -> grpc.Server:
-    """Create, configure interceptors, spin up, and return the running gRPC server."""
+    """Create, configure interceptors, spin up, and return the running gRPC server.
+
+    The RPC worker pool size comes from ``SYSTEM_API_GRPC_WORKERS`` (default
+    ``min(32, 4 * cpu_count)``). At most ``SYSTEM_API_GRPC_MAX_CONCURRENT``
+    RPCs (default ``4 * workers``) are admitted at once; calls beyond that
+    fail fast with ``RESOURCE_EXHAUSTED`` instead of queueing behind the
+    pool. Outbound messages may be up to
+    ``SYSTEM_API_GRPC_MAX_SEND_MESSAGE_BYTES`` (default 64 MiB) so large
+    ``GetJobResults`` count maps are not rejected.
+    """
     
     # Configure telemetry strings prior to startup print
     configure_logging()
     
     ensure_generated()
 
-    from eigen.api.v1 import device_service_pb2 as dev_pb
     from eigen.api.v1 import device_service_pb2_grpc as dev_pb_grpc
-    from eigen.api.v1 import job_service_pb2 as job_pb
     from eigen.api.v1 import job_service_pb2_grpc as job_pb_grpc
-    from eigen.api.v1 import types_pb2 as types_pb
+
+    workers = grpc_worker_count()
 
     # Initialize server infrastructure with tracing and error safety-nets
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=16),
+        futures.ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="system-api-grpc",
+        ),
         interceptors=[
             TracingAndLoggingInterceptor(),
             ValidationAndExceptionInterceptor()
-        ]
+        ],
+        options=[
+            ("grpc.max_send_message_length", _grpc_max_send_message_bytes()),
+        ],
+        maximum_concurrent_rpcs=_grpc_max_concurrent_rpcs(workers),
     )
 
     job_pb_grpc.add_JobServiceServicer_to_server(
-        JobService(job_pb=job_pb, types_pb=types_pb),
+        JobService(),
         server,
     )
     dev_pb_grpc.add_DeviceServiceServicer_to_server(
-        DeviceService(dev_pb=dev_pb, types_pb=types_pb),
+        DeviceService(),
         server,
     )
 
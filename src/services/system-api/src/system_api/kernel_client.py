@@ -6,7 +6,8 @@ import asyncio
 import json
 import logging
 import os
-import uuid
+import secrets
+import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from hashlib import sha256
@@ -56,23 +57,46 @@ class KernelGatewayClient:
         self._stub: kernel_pb_grpc.KernelGatewayServiceStub | None = None
         self._closed = True
         self._job_topologies: dict[str, dict[str, str]] = {}
+        self._connect_lock = threading.Lock()
+        self._connecting: asyncio.Future | None = None
 
     def connect(self) -> None:
-        if self._channel is not None and self._stub is not None:
-            return
+        with self._connect_lock:
+            if self._channel is not None and self._stub is not None:
+                return
+
+            self._channel = grpc.insecure_channel(self.config.grpc_endpoint)
+            self._stub = kernel_pb_grpc.KernelGatewayServiceStub(self._channel)
+            try:
+                grpc.channel_ready_future(self._channel).result(timeout=self.config.timeout_seconds)
+            except Exception as exc:  # pragma: no cover - connectivity failure path
+                self._channel = None
+                self._stub = None
+                raise RuntimeError("failed to connect to Kernel Gateway") from exc
+            self._closed = False
 
-        self._channel = grpc.insecure_channel(self.config.grpc_endpoint)
-        self._stub = kernel_pb_grpc.KernelGatewayServiceStub(self._channel)
-        try:
-            grpc.channel_ready_future(self._channel).result(timeout=self.config.timeout_seconds)
-        except Exception as exc:  # pragma: no cover - connectivity failure path
-            self._channel = None
-            self._stub = None
-            raise RuntimeError("failed to connect to Kernel Gateway") from exc
-        self._closed = False
-        
         logger.info("Connected to Kernel Gateway at %s", self.config.grpc_endpoint)
 
+    async def _ensure_connected(self) -> None:
+        """Run ``connect`` off the event loop, sharing one attempt between callers.
+
+        ``connect`` blocks for up to ``timeout_seconds`` while the kernel is
+        unreachable. All kernel calls share one loop, so concurrent callers
+        await the same in-flight attempt instead of queueing their own.
+        """
+        if not self._closed and self._stub is not None:
+            return
+        pending = self._connecting
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(asyncio.to_thread(self.connect))
+            self._connecting = pending
+            pending.add_done_callback(self._clear_connecting)
+        await asyncio.shield(pending)
+
+    def _clear_connecting(self, future: asyncio.Future) -> None:
+        if self._connecting is future:
+            self._connecting = None
+
     def close(self) -> None:
         if self._channel is not None:
             self._channel.close()
@@ -82,14 +106,14 @@ class KernelGatewayClient:
             logger.info("Kernel client connection closed")
     
     async def __aenter__(self):
-        self.connect()
+        await self._ensure_connected()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         self.close()
     
     def _build_request_metadata(self, public_envelope: dict, source_service: str = "system-api", workload: object | None = None) -> dict:
-        request_id = public_envelope.get("request_id") or str(uuid.uuid4())
+        request_id = public_envelope.get("request_id") or secrets.token_hex(16)
         traceparent = public_envelope.get("traceparent") or self._synthetic_traceparent(request_id)
 
         return {
@@ -356,8 +380,7 @@ class KernelGatewayClient:
         public_envelope: dict,
         workload: object | None = None,
     ) -> dict:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
 
         assert self._stub is not None
         workload_context = self._workload_context(metadata_kvs, workload)
@@ -392,8 +415,7 @@ class KernelGatewayClient:
         }
 
     async def get_job_status(self, job_id: str, public_envelope: dict, workload: object | None = None) -> dict:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
 
         assert self._stub is not None
         request = kernel_pb.GetJobStatusRequest(
@@ -427,8 +449,7 @@ class KernelGatewayClient:
         return result
 
     async def cancel_job(self, job_id: str, public_envelope: dict, workload: object | None = None) -> dict:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
         assert self._stub is not None
 
         request = kernel_pb.CancelJobRequest(
@@ -452,8 +473,7 @@ class KernelGatewayClient:
         public_envelope: dict,
         workload: object | None = None,
     ) -> AsyncIterator[dict]:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
 
         assert self._stub is not None
         request = kernel_pb.StreamJobUpdatesRequest(
@@ -462,7 +482,11 @@ class KernelGatewayClient:
             last_event_seq=int(last_event_seq),
         )
         call = self._stub.StreamJobUpdates(request, timeout=self.config.timeout_seconds)
-        for response in call:
+        while True:
+            # Pull each message off-loop so a long stream does not stall other kernel calls.
+            response = await asyncio.to_thread(next, call, None)
+            if response is None:
+                break
             update = response.update
             yield {
                 "job_id": job_id,
@@ -476,8 +500,7 @@ class KernelGatewayClient:
             }
             
     async def get_job_results(self, job_id: str, public_envelope: dict, workload: object | None = None) -> dict:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
         assert self._stub is not None
         request = kernel_pb.GetJobResultsRequest(metadata=self._request_metadata_proto(public_envelope, workload=workload), job_id=job_id)
         response = await asyncio.to_thread(self._stub.GetJobResults, request, timeout=self.config.timeout_seconds)
@@ -501,8 +524,7 @@ class KernelGatewayClient:
         return result
 
     async def get_dispatch_rationale(self, job_id: str, public_envelope: dict) -> dict:
-        if self._closed or self._stub is None:
-            self.connect()
+        await self._ensure_connected()
         assert self._stub is not None
         request = kernel_pb.GetDispatchRationaleRequest(metadata=self._request_metadata_proto(public_envelope), job_id=job_id)
         response = await asyncio.to_thread(
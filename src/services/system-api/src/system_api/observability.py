@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
 import os
-import re
+import secrets
 import threading
 import time
-import uuid
 from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
@@ -61,9 +61,11 @@ def _log_record_factory(*args, **kwargs):
 
 logging.setLogRecordFactory(_log_record_factory)
 
-_TRACEPARENT_RE = re.compile(
-    r"^(?P<version>[0-9a-f]{2})-(?P<trace_id>[0-9a-f]{32})-(?P<span_id>[0-9a-f]{16})-(?P<trace_flags>[0-9a-f]{2})$"
-)
+# W3C traceparent has a fixed layout: vv-<32 hex trace_id>-<16 hex span_id>-ff.
+_TRACEPARENT_LEN = 55
+_TRACEPARENT_DASHES = (2, 35, 52)
+# Deletes every character allowed in a traceparent; anything left is invalid.
+_TRACEPARENT_CHARS = str.maketrans("", "", "0123456789abcdef-")
 
 _KB_CONTRACT_VERSION = "1.0.0"
 _KB_QUERY_KINDS = (
@@ -102,7 +104,7 @@ _KB_FAILURE_REASONS = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestContext:
     request_id: str
     traceparent: str | None
@@ -115,6 +117,7 @@ class RequestContext:
     service_identity: str | None = None
     sandbox_profile: str | None = None
     replay_marker: str | None = None
+    started_at: float | None = dataclasses.field(default=None, init=False, repr=False)
 
 
 class JsonFormatter(logging.Formatter):
@@ -342,12 +345,16 @@ def append_security_audit_event(event: dict[str, object]) -> None:
 
 
 def trace_id_from_traceparent(traceparent: str | None) -> str | None:
-    if not traceparent:
+    if not traceparent or len(traceparent) != _TRACEPARENT_LEN:
+        return None
+    if traceparent.count("-") != len(_TRACEPARENT_DASHES):
         return None
-    m = _TRACEPARENT_RE.match(traceparent)
-    if not m:
+    for pos in _TRACEPARENT_DASHES:
+        if traceparent[pos] != "-":
+            return None
+    if traceparent.translate(_TRACEPARENT_CHARS):
         return None
-    return m.group("trace_id")
+    return traceparent[3:35]
 
 
 def sanitized_security_metadata(*, subject: str, roles: tuple[str, ...], auth_mode: str, policy_version: str, service_identity: str | None, sandbox_profile: str | None, replay_marker: str | None) -> dict[str, object]:
@@ -363,31 +370,34 @@ def sanitized_security_metadata(*, subject: str, roles: tuple[str, ...], auth_mo
 
 
 def new_request_context(context: grpc.ServicerContext) -> RequestContext:
-    md = {k.lower(): v for (k, v) in (context.invocation_metadata() or [])}
-
-    traceparent = md.get("traceparent")
-    trace_id = md.get("trace_id") or trace_id_from_traceparent(traceparent)
+    # gRPC metadata keys arrive lowercased (HTTP/2), so match them directly
+    # instead of materialising a lowercased copy of the whole metadata.
+    traceparent = trace_id = replay_marker = None
+    for key, value in context.invocation_metadata() or ():
+        if key == "traceparent":
+            traceparent = value
+        elif key == "trace_id":
+            trace_id = value
+        elif key == "x-eigen-replay-marker":
+            replay_marker = value
 
     return RequestContext(
-        request_id=str(uuid.uuid4()),
+        request_id=secrets.token_hex(16),
         traceparent=traceparent,
-        trace_id=trace_id,
-        replay_marker=md.get("x-eigen-replay-marker"),
+        trace_id=trace_id or trace_id_from_traceparent(traceparent),
+        replay_marker=replay_marker,
     )
 
 
 def log_request_start(method: str, rc: RequestContext) -> None:
-    started_at = time.perf_counter()
-    request_id = rc.request_id
-    trace_id = rc.trace_id
-    traceparent = rc.traceparent
-    job_id = rc.job_id
-    setattr(rc, "_started_at", started_at)
+    rc.started_at = time.perf_counter()
+    if not _LOG.isEnabledFor(logging.INFO):
+        return
     previous = _push_log_record_context(
-        request_id=request_id,
-        trace_id=trace_id,
-        traceparent=traceparent,
-        job_id=job_id,
+        request_id=rc.request_id,
+        trace_id=rc.trace_id,
+        traceparent=rc.traceparent,
+        job_id=rc.job_id,
     )
     try:
         _LOG.info(
@@ -407,19 +417,19 @@ def log_request_end(
     traceparent: str | None = None,
     job_id: str | None = None,
 ) -> None:
-    elapsed = max(time.perf_counter() - getattr(rc, "_started_at", time.perf_counter()), 0.0)
-    request_id = request_id or rc.request_id
-    trace_id = trace_id or rc.trace_id
-    traceparent = traceparent or rc.traceparent
-    job_id = job_id or rc.job_id
+    started_at = rc.started_at
+    elapsed = max(time.perf_counter() - started_at, 0.0) if started_at is not None else 0.0
     with _MetricsState.lock:
         _MetricsState.requests_total += 1
         _MetricsState.request_duration_seconds_sum += elapsed
+    # Metrics are always recorded; skip the log-context work when INFO is off.
+    if not _LOG.isEnabledFor(logging.INFO):
+        return
     previous = _push_log_record_context(
-        request_id=request_id,
-        trace_id=trace_id,
-        traceparent=traceparent,
-        job_id=job_id,
+        request_id=request_id or rc.request_id,
+        trace_id=trace_id or rc.trace_id,
+        traceparent=traceparent or rc.traceparent,
+        job_id=job_id or rc.job_id,
     )
     try:
         _LOG.info(
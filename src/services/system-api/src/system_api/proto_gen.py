@@ -19,6 +19,10 @@ packaging a separate SDK. For MVP scaffolding, local generation is acceptable.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
@@ -72,30 +76,83 @@ def get_paths() -> ProtoGenPaths:
     return ProtoGenPaths(repo_root=repo_root, proto_root=proto_root, out_dir=out_dir)
 
 
+def _generated_outputs(paths: ProtoGenPaths, files: Iterable[Path]) -> list[Path]:
+    """Return the ``_pb2.py``/``_pb2_grpc.py`` modules protoc emits for ``files``."""
+    outputs: list[Path] = []
+    for proto in files:
+        stem = paths.out_dir / proto.relative_to(paths.proto_root).with_suffix("")
+        outputs.append(stem.with_name(f"{stem.name}_pb2.py"))
+        outputs.append(stem.with_name(f"{stem.name}_pb2_grpc.py"))
+    return outputs
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return -1.0
+
+
+def _fingerprint_path(paths: ProtoGenPaths) -> Path:
+    return paths.out_dir / "eigen" / ".proto_fingerprint"
+
+
+def _proto_fingerprint(paths: ProtoGenPaths, files: Iterable[Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for proto in files:
+        h.update(proto.relative_to(paths.proto_root).as_posix().encode())
+        h.update(b"\0")
+        h.update(proto.read_bytes())
+    return h.hexdigest()
+
+
+def _write_fingerprint(path: Path, fingerprint: str) -> None:
+    # Unique temp name so concurrent (e.g. xdist) regenerations don't race.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(fingerprint)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
 def ensure_generated(files: Iterable[Path] | None = None) -> None:
-    """Generate python stubs if they're missing or stale."""
+    """Generate python stubs if they're missing or stale.
+
+    Stubs are considered fresh only when every generated module exists and is
+    at least as new as every input ``.proto``; otherwise all of them are
+    regenerated. ``grpc_tools`` is imported only when codegen actually runs.
+
+    The result is memoized per process. A content fingerprint of the protos
+    (``eigen/.proto_fingerprint``) is rewritten on every regeneration and
+    committed alongside the stubs, so a checkout with shuffled mtimes (fresh
+    clone, CI cache restore) does not re-run protoc either.
+    """
+    _ensure_generated(None if files is None else tuple(files))
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_generated(files: tuple[Path, ...] | None) -> None:
     paths = get_paths()
-    if files is None:
-        files = _default_proto_files(paths.proto_root)
-
-    # Heuristic: check representative output files for both public and internal stubs.
-    sentinels = [
-        paths.out_dir / "eigen" / "api" / "v1" / "job_service_pb2.py",
-        paths.out_dir / "eigen" / "internal" / "v1" / "kernel_gateway_pb2.py",
-    ]
-    
-    def _mtime(path: Path) -> float:
-        try:
-            return path.stat().st_mtime
-        except FileNotFoundError:
-            return -1.0
+    files = list(_default_proto_files(paths.proto_root) if files is None else files)
+    outputs = _generated_outputs(paths, files)
 
     newest_proto_mtime = max((_mtime(p) for p in files), default=-1.0)
-    oldest_sentinel_mtime = min((_mtime(s) for s in sentinels), default=-1.0)
-
-    if all(s.exists() for s in sentinels) and oldest_sentinel_mtime >= newest_proto_mtime:
+    oldest_output_mtime = min((_mtime(o) for o in outputs), default=-1.0)
+    if oldest_output_mtime >= 0 and oldest_output_mtime >= newest_proto_mtime:
         return
 
+    fingerprint_path = _fingerprint_path(paths)
+    fingerprint = _proto_fingerprint(paths, files)
+    if oldest_output_mtime >= 0:
+        try:
+            if fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint:
+                return
+        except FileNotFoundError:
+            pass
+
     try:
         from grpc_tools import protoc
     except Exception as e:  # pragma: no cover
@@ -117,3 +174,5 @@ def ensure_generated(files: Iterable[Path] | None = None) -> None:
     rc = protoc.main(cmd)
     if rc != 0:  # pragma: no cover
         raise RuntimeError(f"protoc failed with exit code {rc}: {' '.join(cmd)}")
+
+    _write_fingerprint(fingerprint_path, fingerprint)
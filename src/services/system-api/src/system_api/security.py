@@ -20,6 +20,7 @@ import grpc
 
 from .errors import PublicErrorSpec, abort_public
 from .observability import log_authz_denied, trace_id_from_traceparent, append_security_audit_event, sanitized_security_metadata
+from .settings import int_env
 
 _AUTH_ALLOW_ALL = "allow_all"
 _AUTH_STATIC_TOKEN = "static_token"
@@ -151,15 +152,6 @@ def load_policy_snapshot() -> PolicySnapshot:
     return _load_policy_snapshot(load_security_config())
 
 
-def _int_env(name: str, default: int) -> int:
-    raw = os.getenv(name, str(default))
-    try:
-        value = int(raw)
-    except ValueError:
-        return default
-    return max(1, value)
-
-
 def load_security_config() -> SecurityConfig:
     auth_mode = os.getenv("SYSTEM_API_AUTH_MODE", _AUTH_ALLOW_ALL).strip().lower()
     if auth_mode not in _VALID_AUTH_MODES:
@@ -175,12 +167,12 @@ def load_security_config() -> SecurityConfig:
             if part.strip()
         ),
         static_token_tenant=os.getenv("SYSTEM_API_AUTH_TENANT", ""),
-        max_program_source_bytes=_int_env("SYSTEM_API_MAX_PROGRAM_SOURCE_BYTES", 262_144),
-        max_jobspec_yaml_bytes=_int_env("SYSTEM_API_MAX_JOBSPEC_YAML_BYTES", 65_536),
-        max_submit_metadata_entries=_int_env("SYSTEM_API_MAX_SUBMIT_METADATA_ENTRIES", 64),
-        max_submit_metadata_key_bytes=_int_env("SYSTEM_API_MAX_SUBMIT_METADATA_KEY_BYTES", 128),
-        max_submit_metadata_value_bytes=_int_env("SYSTEM_API_MAX_SUBMIT_METADATA_VALUE_BYTES", 4096),
-        max_submit_dependencies=_int_env("SYSTEM_API_MAX_SUBMIT_DEPENDENCIES", 64),
+        max_program_source_bytes=int_env("SYSTEM_API_MAX_PROGRAM_SOURCE_BYTES", 262_144),
+        max_jobspec_yaml_bytes=int_env("SYSTEM_API_MAX_JOBSPEC_YAML_BYTES", 65_536),
+        max_submit_metadata_entries=int_env("SYSTEM_API_MAX_SUBMIT_METADATA_ENTRIES", 64),
+        max_submit_metadata_key_bytes=int_env("SYSTEM_API_MAX_SUBMIT_METADATA_KEY_BYTES", 128),
+        max_submit_metadata_value_bytes=int_env("SYSTEM_API_MAX_SUBMIT_METADATA_VALUE_BYTES", 4096),
+        max_submit_dependencies=int_env("SYSTEM_API_MAX_SUBMIT_DEPENDENCIES", 64),
         jwt_secret=os.getenv("SYSTEM_API_AUTH_JWT_SECRET", "dev-jwt-secret"),
         jwt_issuer=os.getenv("SYSTEM_API_AUTH_ISSUER", "eigen-auth"),
         jwt_audience=os.getenv("SYSTEM_API_AUTH_AUDIENCE", "eigen-api"),
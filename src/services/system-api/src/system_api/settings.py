@@ -0,0 +1,19 @@
+"""Environment-driven settings shared across system-api modules."""
+from __future__ import annotations
+
+import os
+
+
+def int_env(name: str, default: int) -> int:
+    """Read a positive integer from ``name``; malformed values fall back to ``default``."""
+
+    raw = os.getenv(name, str(default))
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return max(1, value)
+
+
+def grpc_worker_count() -> int:
+    return int_env("SYSTEM_API_GRPC_WORKERS", min(32, (os.cpu_count() or 1) * 4))
@@ -86,16 +86,23 @@ def validate_submit_job(req) -> List[FieldViolation]:
     return violations
 
 
+def _append_if(violations: List[FieldViolation], violation: FieldViolation | None) -> None:
+    if violation is not None:
+        violations.append(violation)
+
+
 def validate_job_id(req, field_name: str = "job_id") -> List[FieldViolation]:
-    return list(required_string(getattr(req, field_name, ""), field_name))
+    violation = required_string(getattr(req, field_name, ""), field_name)
+    return [violation] if violation is not None else []
 
 
 def validate_device_id(req, field_name: str = "device_id") -> List[FieldViolation]:
-    return list(required_string(getattr(req, field_name, ""), field_name))
+    violation = required_string(getattr(req, field_name, ""), field_name)
+    return [violation] if violation is not None else []
 
 
 def validate_reserve_device(req) -> List[FieldViolation]:
     violations: List[FieldViolation] = []
-    violations.extend(required_string(req.device_id, "device_id"))
-    violations.extend(positive_int(req.ttl_seconds, "ttl_seconds"))
+    _append_if(violations, required_string(req.device_id, "device_id"))
+    _append_if(violations, positive_int(req.ttl_seconds, "ttl_seconds"))
     return violations
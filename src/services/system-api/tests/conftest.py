@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import os
 import shutil
 import socket
@@ -13,6 +14,10 @@ PACKAGE_ROOT = Path(__file__).resolve().parents[1] / "src"
 if str(PACKAGE_ROOT) not in sys.path:
     sys.path.insert(0, str(PACKAGE_ROOT))
 
+# protobuf>=4 ships the compiled upb backend; make sure nothing downgrades the
+# test process to the pure-python implementation before the first proto import.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 try:
     import google.rpc  # type: ignore
 except ModuleNotFoundError:
@@ -28,10 +33,18 @@ except ModuleNotFoundError:
         check=True,
     )
 
+import grpc
 import pytest
+from google.protobuf.internal import api_implementation
 
 from system_api.qfs_store import QFS_STORE
 
+if api_implementation.Type() == "python":
+    raise RuntimeError(
+        "system-api tests require a compiled protobuf backend; "
+        "unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python or reinstall protobuf"
+    )
+
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 RUST_ROOT = REPO_ROOT / "src" / "rust"
@@ -228,6 +241,38 @@ def grpc_addr(kernel_addr: str, tmp_path_factory: pytest.TempPathFactory) -> Ite
         os.environ["KERNEL_GRPC_ENDPOINT"] = previous_kernel_grpc_endpoint
 
 
+_CHANNEL_POOL_SIZE = 4
+
+
+@pytest.fixture(scope="module")
+def channel_pool(grpc_addr: str) -> Iterator[tuple[grpc.Channel, ...]]:
+    # Module-scoped to match grpc_addr. Distinct channel args give each channel
+    # its own subchannel, so stubs don't all share one HTTP/2 connection.
+    channels = tuple(
+        grpc.insecure_channel(grpc_addr, options=[("grpc.channel_number", i)])
+        for i in range(_CHANNEL_POOL_SIZE)
+    )
+    try:
+        for channel in channels:
+            grpc.channel_ready_future(channel).result(timeout=5)
+        yield channels
+    finally:
+        for channel in channels:
+            channel.close()
+
+
+@pytest.fixture(scope="module")
+def channel_cycle(channel_pool: tuple[grpc.Channel, ...]) -> Iterator[grpc.Channel]:
+    return itertools.cycle(channel_pool)
+
+
+@pytest.fixture
+def job_stub(channel_cycle: Iterator[grpc.Channel]):
+    from eigen.api.v1 import job_service_pb2_grpc as job_pb_grpc
+
+    return job_pb_grpc.JobServiceStub(next(channel_cycle))
+
+
 @pytest.fixture(autouse=True)
 def _clean_qfs_store(_shared_qfs_root: None) -> Iterator[None]:
     QFS_STORE.clear()
@@ -31,7 +31,7 @@ def _make_service() -> JobService:
             }
 
     kernel_client = _KernelClient()
-    return JobService(job_pb=job_pb, types_pb=types_pb, kernel_client=kernel_client)
+    return JobService(kernel_client=kernel_client)
 
 
 def test_submit_job_delegates_to_kernel_client() -> None:
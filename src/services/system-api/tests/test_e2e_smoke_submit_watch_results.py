@@ -140,7 +140,7 @@ def _make_service(tmp_path, monkeypatch) -> JobService:
                 yield update
 
     kernel_client = _KernelClient()
-    return JobService(job_pb=job_pb, types_pb=types_pb, kernel_client=kernel_client)
+    return JobService(kernel_client=kernel_client)
 
 
 def test_submit_watch_status_results_thin_client(tmp_path, monkeypatch):
@@ -14,7 +14,6 @@ from system_api.proto_gen import ensure_generated
 ensure_generated()
 
 from eigen.api.v1 import job_service_pb2 as job_pb  # noqa: E402
-from eigen.api.v1 import types_pb2 as types_pb  # noqa: E402
 
 CONTRACT_FIXTURE_ROOT = Path(__file__).parent / "fixtures" / "contracts" / "explain_execution_v1"
 
@@ -48,7 +47,7 @@ def _make_service(tmp_path, monkeypatch, kernel_client) -> JobService:
     monkeypatch.setenv("SYSTEM_API_AUTH_MODE", "allow_all")
     monkeypatch.setenv("SYSTEM_API_IDEMPOTENCY_STORE_PATH", str(tmp_path / "idempotency.json"))
     monkeypatch.setenv("SYSTEM_API_IDEMPOTENCY_TTL_SECONDS", "60")
-    return JobService(job_pb=job_pb, types_pb=types_pb, kernel_client=kernel_client)
+    return JobService(kernel_client=kernel_client)
 
 
 def test_explain_execution_success_contract_fixture_is_stable(tmp_path, monkeypatch) -> None:
@@ -141,3 +140,33 @@ def test_explain_execution_error_model_maps_invalid_and_missing_locally(tmp_path
             _Context(),
         )
     assert missing_err.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_explain_execution_waits_for_pending_dispatch_decision(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SYSTEM_API_DISPATCH_RATIONALE_POLL_SECONDS", "0.001")
+    kernel_client = AsyncMock()
+    kernel_client._closed = False
+    kernel_client.get_dispatch_rationale = AsyncMock(
+        side_effect=[
+            _AbortError(grpc.StatusCode.FAILED_PRECONDITION, "decision not recorded yet"),
+            {"version": "2.3.0", "selected_backend": "sim:local"},
+        ]
+    )
+    kernel_client.get_job_status = AsyncMock(return_value={"state": "TASK_STATE_RUNNING"})
+    service = _make_service(tmp_path, monkeypatch, kernel_client)
+
+    rationale = service.GetDispatchRationale(
+        job_pb.GetDispatchRationaleRequest(job_id="job-thin-003"),
+        _Context(),
+    ).rationale
+
+    assert rationale.selected_backend == "sim:local"
+    assert kernel_client.get_dispatch_rationale.await_count == 2
+    assert kernel_client.get_job_status.await_count == 1
+
+
+def test_dispatch_rationale_poll_interval_has_a_positive_floor(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SYSTEM_API_DISPATCH_RATIONALE_POLL_SECONDS", "0")
+    service = _make_service(tmp_path, monkeypatch, AsyncMock())
+
+    assert service._dispatch_rationale_poll_sec == 0.01
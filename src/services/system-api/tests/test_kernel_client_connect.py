@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from system_api.grpc_impl import _KernelLoop
+from system_api.kernel_client import KernelClientConfig, KernelGatewayClient
+
+
+def _unused_addr() -> str:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{s.getsockname()[1]}"
+
+
+@pytest.fixture
+def kernel_loop():
+    loop = _KernelLoop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+def test_concurrent_calls_share_one_connect_attempt_while_kernel_is_down(kernel_loop: _KernelLoop) -> None:
+    timeout = 0.5
+    client = KernelGatewayClient(KernelClientConfig(grpc_endpoint=_unused_addr(), timeout_seconds=timeout))
+    errors: list[BaseException] = []
+
+    def _call() -> None:
+        try:
+            kernel_loop.run(client.get_job_status(job_id="job-1", public_envelope={}))
+        except BaseException as exc:  # noqa: BLE001 - collected for assertions
+            errors.append(exc)
+
+    workers = [threading.Thread(target=_call) for _ in range(4)]
+    started = time.monotonic()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=10)
+    elapsed = time.monotonic() - started
+
+    assert len(errors) == 4
+    assert all(isinstance(exc, RuntimeError) for exc in errors)
+    # Serialized connects on the shared loop would take 4 * timeout.
+    assert elapsed < 2 * timeout
+
+
+def test_connect_does_not_block_the_kernel_loop(kernel_loop: _KernelLoop) -> None:
+    client = KernelGatewayClient(KernelClientConfig(grpc_endpoint=_unused_addr(), timeout_seconds=1.0))
+
+    async def _noop() -> str:
+        return "ok"
+
+    def _connect() -> None:
+        with pytest.raises(RuntimeError):
+            kernel_loop.run(client.get_job_status(job_id="job-1", public_envelope={}))
+
+    connecting = threading.Thread(target=_connect)
+    connecting.start()
+    try:
+        time.sleep(0.1)
+        started = time.monotonic()
+        assert kernel_loop.run(_noop()) == "ok"
+        assert time.monotonic() - started < 0.5
+    finally:
+        connecting.join(timeout=5)
+
+
+def test_open_streams_do_not_starve_unary_kernel_calls(monkeypatch: pytest.MonkeyPatch, kernel_loop: _KernelLoop):
+    # More open streams than asyncio's default executor has threads.
+    streams = min(32, (os.cpu_count() or 1) + 4)
+    monkeypatch.setenv("SYSTEM_API_GRPC_WORKERS", str(streams + 1))
+    released = threading.Event()
+
+    async def _open_stream():
+        # Mirrors stream_job_updates holding an executor thread in next(call).
+        return await asyncio.to_thread(released.wait, 10)
+
+    async def _unary():
+        return await asyncio.to_thread(lambda: "ok")
+
+    workers = [threading.Thread(target=kernel_loop.run, args=(_open_stream(),)) for _ in range(streams)]
+    for worker in workers:
+        worker.start()
+    try:
+        time.sleep(0.1)
+        started = time.monotonic()
+        assert kernel_loop.run(_unary()) == "ok"
+        assert time.monotonic() - started < 1.0
+    finally:
+        released.set()
+        for worker in workers:
+            worker.join(timeout=5)
+
+
+def test_close_stops_the_loop_thread_and_executor(kernel_loop: _KernelLoop):
+    async def _threads():
+        worker = await asyncio.to_thread(threading.current_thread)
+        return threading.current_thread(), worker
+
+    loop_thread, executor_thread = kernel_loop.run(_threads())
+    kernel_loop.close()
+
+    assert not loop_thread.is_alive()
+    assert not executor_thread.is_alive()
+    # A closed loop restarts on the next call.
+    restarted_loop_thread, _ = kernel_loop.run(_threads())
+    assert restarted_loop_thread is not loop_thread
@@ -6,10 +6,14 @@ from datetime import datetime, timezone
 
 import pytest
 
+from system_api import observability
 from system_api.grpc_impl import JobService
 from system_api.observability import (
+    RequestContext,
     _MetricsState,
     append_security_audit_event,
+    log_request_end,
+    log_request_start,
     record_kb_contract_marker,
     record_kb_fallback,
     record_kb_learning_failure,
@@ -18,6 +22,7 @@ from system_api.observability import (
     record_kb_replay_failure,
     record_public_api_contract_marker,
     start_metrics_server,
+    trace_id_from_traceparent,
 )
 from system_api.proto_gen import ensure_generated
 
@@ -200,6 +205,46 @@ def test_public_contract_marker_uses_bounded_labels_and_contract_version():
     }
 
 
+def test_request_metrics_are_recorded_when_info_logging_is_disabled(caplog, monkeypatch):
+    caplog.set_level("WARNING", logger="system_api")
+
+    def _unexpected_log_context(**_kwargs):
+        raise AssertionError("log record context must not be built when INFO is disabled")
+
+    monkeypatch.setattr(observability, "_push_log_record_context", _unexpected_log_context)
+    _MetricsState.requests_total = 0
+    rc = RequestContext(request_id="req-quiet", traceparent=None, trace_id=None)
+
+    log_request_start("JobService.GetJobStatus", rc)
+    log_request_end("JobService.GetJobStatus", rc)
+
+    assert _MetricsState.requests_total == 1
+    assert not [record for record in caplog.records if record.message in {"rpc_start", "rpc_end"}]
+
+
+@pytest.mark.parametrize(
+    "traceparent",
+    [
+        None,
+        "",
+        "00-4BF92F3577B34DA6A3CE929D0E0E4736-00f067aa0ba902b7-01",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01\n",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-1",
+        "00-4bf92f3577b34da6a3ce929d0e0e4736_00f067aa0ba902b7-01",
+        "0--4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+    ],
+)
+def test_trace_id_from_traceparent_rejects_malformed_values(traceparent):
+    assert trace_id_from_traceparent(traceparent) is None
+
+
+def test_trace_id_from_traceparent_extracts_w3c_trace_id():
+    assert (
+        trace_id_from_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+        == "4bf92f3577b34da6a3ce929d0e0e4736"
+    )
+
+
 def test_submit_job_marker_and_traceparent_correlation_from_public_envelope(caplog, tmp_path, monkeypatch):
     class _Context:
         def invocation_metadata(self):
@@ -242,7 +287,7 @@ def test_submit_job_marker_and_traceparent_correlation_from_public_envelope(capl
                 "created_at": datetime.now(timezone.utc),
             }
 
-    service = JobService(job_pb=job_pb, types_pb=types_pb, kernel_client=_KernelClient())
+    service = JobService(kernel_client=_KernelClient())
     response = service.SubmitJob(request, _Context())
     assert response.job_id
     assert _MetricsState.public_api_contract_requests_total[("1.0.0", "accepted")] == 1
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from system_api import proto_gen
+
+
+@pytest.fixture
+def proto_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    paths = proto_gen.ProtoGenPaths(repo_root=tmp_path, proto_root=tmp_path / "proto", out_dir=tmp_path / "out")
+    proto = paths.proto_root / "eigen" / "api" / "v1" / "sample.proto"
+    proto.parent.mkdir(parents=True)
+    proto.write_text('syntax = "proto3";\n', encoding="utf-8")
+    outputs = proto_gen._generated_outputs(paths, [proto])
+    (paths.out_dir / "eigen").mkdir(parents=True)
+
+    calls: list[list[str]] = []
+
+    def _fake_protoc(cmd: list[str]) -> int:
+        calls.append(cmd)
+        for output in outputs:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text("# generated\n", encoding="utf-8")
+        return 0
+
+    monkeypatch.setattr(proto_gen, "get_paths", lambda: paths)
+    monkeypatch.setattr("grpc_tools.protoc.main", _fake_protoc)
+    proto_gen._ensure_generated.cache_clear()
+    yield paths, proto, outputs, calls
+    proto_gen._ensure_generated.cache_clear()
+
+
+def _age(path: Path, seconds: float) -> None:
+    stamp = path.stat().st_mtime - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _ensure(proto: Path) -> None:
+    proto_gen._ensure_generated.cache_clear()
+    proto_gen.ensure_generated([proto])
+
+
+def test_missing_outputs_run_protoc_and_write_marker(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+
+    _ensure(proto)
+
+    assert len(calls) == 1
+    assert all(output.exists() for output in outputs)
+    marker = proto_gen._fingerprint_path(paths).read_text(encoding="utf-8")
+    assert marker == proto_gen._proto_fingerprint(paths, [proto])
+
+
+def test_fresh_outputs_skip_protoc(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+    _ensure(proto)
+    proto_gen._fingerprint_path(paths).unlink()
+    _age(proto, 60)
+
+    _ensure(proto)
+
+    assert len(calls) == 1
+
+
+def test_any_stale_output_regenerates_without_marker(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+    _ensure(proto)
+    proto_gen._fingerprint_path(paths).unlink()
+    _age(outputs[-1], 60)
+
+    _ensure(proto)
+
+    assert len(calls) == 2
+
+
+def test_matching_marker_skips_protoc_despite_stale_mtimes(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+    _ensure(proto)
+    for output in outputs:
+        _age(output, 60)
+
+    _ensure(proto)
+
+    assert len(calls) == 1
+
+
+def test_changed_proto_regenerates_despite_marker(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+    _ensure(proto)
+    for output in outputs:
+        _age(output, 60)
+    proto.write_text('syntax = "proto3";\npackage sample;\n', encoding="utf-8")
+
+    _ensure(proto)
+
+    assert len(calls) == 2
+    marker = proto_gen._fingerprint_path(paths).read_text(encoding="utf-8")
+    assert marker == proto_gen._proto_fingerprint(paths, [proto])
+
+
+def test_ensure_generated_is_memoized(proto_tree) -> None:
+    paths, proto, outputs, calls = proto_tree
+    _ensure(proto)
+    outputs[0].unlink()
+
+    proto_gen.ensure_generated([proto])
+
+    assert len(calls) == 1
@@ -55,3 +55,4 @@ def test_stream_job_updates_seq_and_resume(grpc_addr: str):
         types_pb.JOB_STATE_CANCELLED,
         types_pb.JOB_STATE_TIMEOUT,
     }
+
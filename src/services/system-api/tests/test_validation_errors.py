@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import socket
 import time
+from typing import Iterator
 
 import grpc
 import pytest
@@ -21,6 +22,37 @@ from eigen.api.v1 import job_service_pb2_grpc as job_pb_grpc  # noqa: E402
 from eigen.api.v1 import types_pb2 as types_pb  # noqa: E402
 
 
+# Requests are never mutated and gRPC only serializes them, so build them once.
+_MINIMAL_SUBMIT = job_pb.SubmitJobRequest(
+    name="validation-smoke",
+    target="sim:local",
+    eigen_lang=types_pb.EigenLangSource(
+        source=(
+            b"from eigen_lang import hybrid_program\n\n"
+            b"@hybrid_program()\n"
+            b"def main():\n"
+            b"    return 0\n"
+        ),
+        entrypoint="main",
+    ),
+)
+_EMPTY_STATUS = job_pb.GetJobStatusRequest()
+_UNKNOWN_STATUS = job_pb.GetJobStatusRequest(job_id="job_missing_123")
+_UNKNOWN_RESULTS = job_pb.GetJobResultsRequest(job_id="job_missing_123")
+_BAD_RESERVE = dev_pb.ReserveDeviceRequest(device_id="", ttl_seconds=0)
+
+# case id -> (stub, method, request, required BadRequest fields)
+_INVALID_ARGUMENT_CASES = {
+    "get_job_status_missing_job_id": ("job", "GetJobStatus", _EMPTY_STATUS, {"job_id"}),
+    "reserve_device_invalid_ttl": ("device", "ReserveDevice", _BAD_RESERVE, {"device_id", "ttl_seconds"}),
+}
+# case id -> (stub, method, request)
+_NOT_FOUND_CASES = {
+    "get_job_status_unknown_job_id": ("job", "GetJobStatus", _UNKNOWN_STATUS),
+    "get_job_results_unknown_job_id": ("job", "GetJobResults", _UNKNOWN_RESULTS),
+}
+
+
 def _free_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
         sock.bind(("127.0.0.1", 0))
@@ -41,35 +73,45 @@ def _reserve(
     )
 
 
+_BAD_REQUEST_TYPE_URL = "type.googleapis.com/" + error_details_pb2.BadRequest.DESCRIPTOR.full_name
+
+
 def _extract_bad_request(err: grpc.RpcError) -> error_details_pb2.BadRequest:
     st = rpc_status.from_call(err)
     assert st is not None, "expected google.rpc.Status in trailing metadata"
 
-    bad = error_details_pb2.BadRequest()
     assert len(st.details) >= 1
-    assert any(detail.Unpack(bad) for detail in st.details)
-    return bad
-
-
-def test_submit_job_minimal_valid_request_is_accepted(grpc_addr: str):
-    channel = grpc.insecure_channel(grpc_addr)
-    stub = job_pb_grpc.JobServiceStub(channel)
-
-    response = stub.SubmitJob(
-        job_pb.SubmitJobRequest(
-            name="validation-smoke",
-            target="sim:local",
-            eigen_lang=types_pb.EigenLangSource(
-                source=(
-                    b"from eigen_lang import hybrid_program\n\n"
-                    b"@hybrid_program()\n"
-                    b"def main():\n"
-                    b"    return 0\n"
-                ),
-                entrypoint="main",
-            ),
-        )
-    )
+    # ErrorInfo always leads the details, so match BadRequest by type URL.
+    detail = next((d for d in st.details if d.type_url == _BAD_REQUEST_TYPE_URL), None)
+    assert detail is not None, "expected google.rpc.BadRequest in status details"
+    return error_details_pb2.BadRequest.FromString(detail.value)
+
+
+@pytest.fixture(scope="module")
+def expected_errors(channel_cycle: Iterator[grpc.Channel]) -> dict[str, grpc.RpcError]:
+    """Dispatch the error-path RPCs concurrently and collect their errors by key."""
+    stub_types = {
+        "job": job_pb_grpc.JobServiceStub,
+        "device": dev_pb_grpc.DeviceServiceStub,
+    }
+    calls = {key: case[:3] for key, case in _INVALID_ARGUMENT_CASES.items()}
+    calls.update(_NOT_FOUND_CASES)
+    # Spread the concurrent calls over the pool rather than one connection.
+    futures = {
+        key: getattr(stub_types[stub](next(channel_cycle)), method).future(req)
+        for key, (stub, method, req) in calls.items()
+    }
+    errors: dict[str, grpc.RpcError] = {}
+    for key, future in futures.items():
+        try:
+            future.result()
+        except grpc.RpcError as e:
+            errors[key] = e
+    return errors
+
+
+def test_submit_job_minimal_valid_request_is_accepted(job_stub: job_pb_grpc.JobServiceStub):
+    response = job_stub.SubmitJob(_MINIMAL_SUBMIT)
     assert response.job_id
     assert response.status.job_id == response.job_id
     assert response.status.state in {
@@ -80,47 +122,21 @@ def test_submit_job_minimal_valid_request_is_accepted(grpc_addr: str):
     }
 
 
-def test_get_job_status_missing_job_id(grpc_addr: str):
-    channel = grpc.insecure_channel(grpc_addr)
-    stub = job_pb_grpc.JobServiceStub(channel)
-
-    with pytest.raises(grpc.RpcError) as e:
-        stub.GetJobStatus(job_pb.GetJobStatusRequest())
-
-    assert e.value.code() == grpc.StatusCode.INVALID_ARGUMENT
-
-    bad = _extract_bad_request(e.value)
-    fields = {v.field for v in bad.field_violations}
-    assert "job_id" in fields
-
-
-def test_unknown_job_id_returns_not_found(grpc_addr: str):
-    channel = grpc.insecure_channel(grpc_addr)
-    stub = job_pb_grpc.JobServiceStub(channel)
-
-    with pytest.raises(grpc.RpcError) as e_status:
-        stub.GetJobStatus(job_pb.GetJobStatusRequest(job_id="job_missing_123"))
-    assert e_status.value.code() == grpc.StatusCode.NOT_FOUND
-
-    with pytest.raises(grpc.RpcError) as e_results:
-        stub.GetJobResults(job_pb.GetJobResultsRequest(job_id="job_missing_123"))
-    assert e_results.value.code() == grpc.StatusCode.NOT_FOUND
-
-
-def test_reserve_device_invalid_ttl(grpc_addr: str):
-    channel = grpc.insecure_channel(grpc_addr)
-    stub = dev_pb_grpc.DeviceServiceStub(channel)
-
-    with pytest.raises(grpc.RpcError) as e:
-        stub.ReserveDevice(dev_pb.ReserveDeviceRequest(device_id="", ttl_seconds=0))
+@pytest.mark.parametrize("case", sorted(_INVALID_ARGUMENT_CASES))
+def test_invalid_request_returns_bad_request(expected_errors: dict[str, grpc.RpcError], case: str):
+    err = expected_errors.get(case)
+    assert err is not None, f"expected {case} to fail"
+    assert err.code() == grpc.StatusCode.INVALID_ARGUMENT
 
-    assert e.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    fields = {v.field for v in _extract_bad_request(err).field_violations}
+    assert _INVALID_ARGUMENT_CASES[case][3] <= fields
 
-    bad = _extract_bad_request(e.value)
-    fields = {v.field for v in bad.field_violations}
 
-    assert "device_id" in fields
-    assert "ttl_seconds" in fields
+@pytest.mark.parametrize("case", sorted(_NOT_FOUND_CASES))
+def test_unknown_job_id_returns_not_found(expected_errors: dict[str, grpc.RpcError], case: str):
+    err = expected_errors.get(case)
+    assert err is not None, f"expected {case} to fail"
+    assert err.code() == grpc.StatusCode.NOT_FOUND
 
 
 def test_reserve_device_creates_renews_and_survives_restart(monkeypatch: pytest.MonkeyPatch, tmp_path):